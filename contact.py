@@ -1,9 +1,6 @@
 import streamlit as st
 import re
 import time
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import json
 
 def is_valid_email(email):
@@ -52,6 +49,11 @@ def contact_form():
                 "message": message
             }
 
+            # Only needed once a message is sent, so kept out of every page's import
+            import smtplib
+            from email.mime.text import MIMEText
+            from email.mime.multipart import MIMEMultipart
+
             # Email configuration
             smtp_server = 'smtp.gmail.com'  # Replace with your SMTP server
             smtp_port = 587  # For TLS
@@ -1,8 +1,18 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import datetime
+import functools
+import os
+import glob
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor
 import random
 from fp.fp import FreeProxy
 
@@ -10,6 +20,80 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.colors as pc
 
+CACHE_DIR = ".cache"
+
+# yfinance periods, intervals and the technical indicators offered in the sidebars
+PERIOD_OPTIONS = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
+INTERVAL_OPTIONS = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"]
+INDICATOR_OPTIONS = ['SMA_20', 'SMA_50', 'SMA_200', 'SMA_X', 'EMA_20', 'EMA_50', 'EMA_200', 'EMA_X', 'ATR', 'MACD', 'RSI']
+
+# Shared st.plotly_chart config, drops the Plotly logo from every chart's modebar
+PLOTLY_CONFIG = {'displaylogo': False}
+
+def cache_path(key, day=None, ext="json"):
+    key = "".join(c if c.isalnum() or c in ".-=^" else "_" for c in key)
+    day = day or datetime.date.today().strftime('%Y%m%d')
+    return os.path.join(CACHE_DIR, f"{key}_{day}.{ext}")
+
+def remove_old_cache(key, ext="json"):
+    for old_path in glob.glob(cache_path(key, day="*", ext=ext)):
+        os.remove(old_path)
+
+def read_statement_cache(key):
+    # Financial statements change at most once a quarter, reuse today's copy across sessions
+    path = cache_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            df = pd.read_json(f, orient='split', convert_axes=False)
+        df.columns = pd.to_datetime(df.columns)
+        return df
+    except (OSError, ValueError):
+        return None
+
+def write_statement_cache(key, df):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        remove_old_cache(key)
+        with open(cache_path(key), "w") as f:
+            f.write(df.to_json(orient='split', date_format='iso'))
+    except OSError:
+        pass
+
+def remove_cache_files(ext):
+    try:
+        for path in glob.glob(os.path.join(CACHE_DIR, f"*.{ext}")):
+            os.remove(path)
+    except OSError:
+        pass
+
+def clear_statement_cache():
+    remove_cache_files("json")
+
+def read_history_cache(key):
+    path = cache_path(key, ext="parquet")
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path)
+    except (OSError, ValueError, ImportError):
+        return None
+
+def clear_history_cache():
+    remove_cache_files("parquet")
+
+def write_history_cache(key, df):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        remove_old_cache(key, ext="parquet")
+        df.to_parquet(cache_path(key, ext="parquet"), compression='zstd')
+    except (OSError, ValueError, ImportError):
+        pass
+
+# yf.download keeps its results in module-global state, so sessions must not run it at the same time
+YF_DOWNLOAD_LOCK = threading.Lock()
+
 def get_proxy_dict(probability=0.5):
     if random.random() < probability:
         proxy = FreeProxy(rand=True).get()
@@ -20,7 +104,7 @@ def get_proxy_dict(probability=0.5):
     else:
         return None
 
-@st.cache_data
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_info(ticker):
     proxy = get_proxy_dict()
     yf.set_config(proxy=proxy)
@@ -35,8 +119,37 @@ def fetch_info(ticker):
     except Exception as e:
         return e
 
-@st.cache_data
+def fetch_infos(tickers):
+    if len(tickers) == 0:
+        return {}
+    # fetch_info keeps the per-ticker cache, the pool only overlaps the slow cache misses
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers)),
+                            initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        infos = executor.map(fetch_info, tickers)
+    return dict(zip(tickers, infos))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_fast_info(ticker, keys=("last_price", "previous_close")):
+    proxy = get_proxy_dict()
+    yf.set_config(proxy=proxy)
+    ticker = yf.Ticker(ticker)
+    try:
+        # Each fast_info key can trigger its own history request, so only read the ones asked for.
+        # A value is None when that history comes back empty
+        fast_info = ticker.fast_info
+        return {key: fast_info[key] for key in keys}
+    except Exception as e:
+        return e
+
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_history(ticker, period="3mo", interval="1d", start=None):
+    if start:
+        # Long histories from a fixed start (financial ratios) are kept on disk for the day
+        key = f"history_{ticker}_{interval}_{pd.Timestamp(start).strftime('%Y%m%d')}"
+        hist = read_history_cache(key)
+        if hist is not None:
+            return hist
     proxy = get_proxy_dict()
     yf.set_config(proxy=proxy)
     ticker = yf.Ticker(ticker)
@@ -46,6 +159,8 @@ def fetch_history(ticker, period="3mo", interval="1d", start=None):
                 start=start,
                 interval=interval
             )
+            if not hist.empty:
+                write_history_cache(key, hist)
         else:
             hist = ticker.history(
                 period=period,
@@ -57,64 +172,143 @@ def fetch_history(ticker, period="3mo", interval="1d", start=None):
     except Exception as e:
         return e
 
-@st.cache_data
-def fetch_balance(ticker, tp="Annual"):
-    ticker = yf.Ticker(ticker)
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_history_multiple(tickers, period="3mo", interval="1d"):
+    proxy = get_proxy_dict()
+    yf.set_config(proxy=proxy)
     try:
-        if tp == "Annual":
-            bs = ticker.balance_sheet
-        else:
-            bs = ticker.quarterly_balance_sheet
-        return bs.loc[:, bs.isna().mean() < 0.5]
+        # One request for all the symbols instead of one per ticker.
+        # ignore_tz=True keeps each symbol's exchange-local times (intraday would otherwise be UTC),
+        # but unlike Ticker.history the index is tz-naive for every interval
+        with YF_DOWNLOAD_LOCK:
+            data = yf.download(
+                tickers,
+                period=period,
+                interval=interval,
+                group_by='ticker',
+                actions=True,  # Keep the Dividends/Stock Splits columns Ticker.history returns
+                threads=True,
+                progress=False,
+                auto_adjust=True,  # Same prices as Ticker.history in fetch_history
+                ignore_tz=True
+            )
+    except Exception as e:
+        return e
 
+    hists = {}
+    for ticker in tickers:
+        # yf.download upper-cases the symbols, the result stays keyed by what the user typed
+        symbol = ticker.upper()
+        if symbol in data.columns.get_level_values(0):
+            # The index is the union of all the symbols' dates, drop the ones this ticker didn't trade
+            hist = data[symbol].dropna(subset=['Close'])
+        else:
+            hist = pd.DataFrame()
+        if hist.empty:
+            hists[ticker] = ValueError(f"No price data found for {ticker}")
+        else:
+            hists[ticker] = hist
+
+    return hists
+
+@functools.lru_cache(maxsize=256)
+def get_ticker(symbol, day):
+    # One Ticker per symbol and day, so the statement fetchers share what yfinance memoizes
+    return yf.Ticker(symbol)
+
+def get_statement(ticker, name, tp, annual, quarterly):
+    key = f"{name}_{ticker}_{tp}"
+    df = read_statement_cache(key)
+    if df is None:
+        ticker = get_ticker(ticker, datetime.date.today())
+        df = getattr(ticker, annual if tp == "Annual" else quarterly)
+        if not df.empty:
+            write_statement_cache(key, df)
+    return df.loc[:, df.isna().mean() < 0.5]
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def fetch_balance(ticker, tp="Annual"):
+    try:
+        return get_statement(ticker, "balance", tp, "balance_sheet", "quarterly_balance_sheet")
     except Exception as e:
         return e
 
-@st.cache_data
+@st.cache_data(ttl=86400, show_spinner=False)
 def fetch_income(ticker, tp="Annual"):
-    ticker = yf.Ticker(ticker)
     try:
-        if tp == "Annual":
-            ins = ticker.income_stmt
-        else:
-            ins = ticker.quarterly_income_stmt
-        return ins.loc[:, ins.isna().mean() < 0.5]
-
+        return get_statement(ticker, "income", tp, "income_stmt", "quarterly_income_stmt")
     except Exception as e:
         return e
 
-@st.cache_data
+@st.cache_data(ttl=86400, show_spinner=False)
 def fetch_cash(ticker, tp="Annual"):
-    ticker = yf.Ticker(ticker)
     try:
-        if tp == "Annual":
-            cf = ticker.cashflow
-        else:
-            cf = ticker.quarterly_cashflow
-        return cf.loc[:, cf.isna().mean() < 0.5]
-
+        return get_statement(ticker, "cash", tp, "cashflow", "quarterly_cashflow")
     except Exception as e:
         return e
 
-@st.cache_data
+@st.cache_data(ttl=86400, show_spinner=False)
 def fetch_splits(ticker):
-    ticker = yf.Ticker(ticker)
+    ticker = get_ticker(ticker, datetime.date.today())
     return ticker.splits
 
-@st.cache_data
+# One pooled session for the table scrapes so the TLS connection to Yahoo is reused
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
+HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+def get_table(url, proxies_dict=None):
+    response = HTTP_SESSION.get(url, proxies=proxies_dict, timeout=5)
+    response.raise_for_status()
+    # Only the first table is used, so parse just that one instead of every table on the page
+    tables = lxml.html.fromstring(response.content).xpath('//table')
+    if len(tables) == 0:
+        raise ValueError(f"No tables found at {url}")
+    table = tables[0]
+
+    # Like read_html(displayed_only=True), hidden nodes must not end up in the cell text
+    for node in table.xpath('.//*[@style]'):
+        if "display:none" in node.get('style').replace(" ", "").lower():
+            node.drop_tree()
+
+    def cells(tr):
+        return [" ".join(cell.text_content().split()) for cell in tr.xpath('./td|./th')]
+
+    header_rows = table.xpath('./thead/tr') or table.xpath('.//tr')[:1]
+    if len(header_rows) == 0:
+        raise ValueError(f"Empty table at {url}")
+    header = cells(header_rows[-1])
+    # libxml2 doesn't add a missing <tbody>, so fall back to every row that isn't a header row
+    body_rows = table.xpath('./tbody/tr') or [tr for tr in table.xpath('.//tr') if tr not in header_rows]
+
+    # Pad or trim every row to the header width, as read_html does for ragged rows
+    width = len(header)
+    rows = [(row + [None] * width)[:width] for row in map(cells, body_rows) if row]
+    return pd.DataFrame(rows, columns=header)
+
+@st.cache_data(ttl=60, show_spinner=False)
 def fetch_table(url):
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
     try:
         proxy = FreeProxy().get()
         proxies_dict = {
             "http": proxy
         }
-        response = requests.get(url, headers=headers, proxies=proxies_dict, timeout=5)
-        df = pd.read_html(response.content)
-        return df[0]
+        return get_table(url, proxies_dict)
     except Exception as e:
         return e
 
+def fetch_tables(urls):
+    # fetch_table keeps the per-page cache, the pool only fires the cache misses at the same time
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(urls),
+                            initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        tables = executor.map(fetch_table, urls)
+    return dict(zip(urls, tables))
+
 def format_value(value):
     # Split the string at the first space
     base_value, change = value.split(' ', 1)
@@ -128,6 +322,12 @@ def format_value(value):
     # Create the formatted string
     return f"{base_value}<br><span style='color: {color};'>{change}</span>"
 
+def pct_labels(pct):
+    # Bar text for a series of rounded % changes: "+x%" for gains, "x%" otherwise, "" for NaN
+    labels = pct.astype(str) + "%"
+    labels = labels.where(~(pct > 0), "+" + labels)
+    return labels.where(pct.notna(), "").tolist()
+
 def remove_duplicates(lst):
     seen = set()
     result = []
@@ -137,6 +337,29 @@ def remove_duplicates(lst):
             seen.add(item)
     return result
 
+def metrics_grid(df, rows, cols, symbols=None, show_symbol=True):
+    # Look the symbols up once instead of filtering the whole table per metric
+    if symbols is not None:
+        # First row per symbol, like the old .iloc[0], so a repeated symbol can't shift the grid
+        df = df.drop_duplicates('Symbol').set_index('Symbol', drop=False).loc[symbols[:rows * cols]]
+    records = df.iloc[:rows * cols].to_dict('records')
+
+    with st.container(border=True):
+        i = 0
+        for _ in range(rows):
+            for col in st.columns(cols, gap="small"):
+                with col:
+                    row = records[i]
+                    name = row['Name']
+                    symbol = row['Symbol']
+                    price, change, change_pt = row['Price'].split()
+                    st.metric(
+                        label=f'{name} ({symbol})' if show_symbol else f'{name}',
+                        value=f'{price}',
+                        delta=f'{change} {change_pt}'
+                    )
+                i += 1
+
 def top_table(df):
     fig = go.Figure(data=[go.Table(
         header=dict(values=list(df.columns),
@@ -197,7 +420,8 @@ def info_table(info):
     elif TYPE == "CURRENCY":
         pass
 
-    df = pd.DataFrame([data]).T
+    # Build the single column directly instead of a one-row frame that then gets transposed
+    df = pd.Series(data, dtype=object).to_frame()
 
     return df
 
@@ -229,7 +453,7 @@ def plot_gauge(df, ticker):
 
     return fig
 
-def plot_candles_stick_bar(df, title="", currency=""):
+def plot_candles_stick_bar(df, title="", currency="", uirevision=None):
 
     rows = 1
     row_heights = [7]
@@ -298,7 +522,7 @@ def plot_candles_stick_bar(df, title="", currency=""):
         if col_name == 'Volume':
             row += 1
 
-            volume_colors = ['green' if df['Close'].iloc[i] > df['Open'].iloc[i] else 'red' for i in range(len(df))]
+            volume_colors = np.where(df['Close'] > df['Open'], 'green', 'red')
 
             fig.add_trace(go.Bar(x=df.index,
                                  y=df[col_name],
@@ -333,7 +557,7 @@ def plot_candles_stick_bar(df, title="", currency=""):
                               row=row, col=1)
 
             if 'MACD_Hist' in df.columns:
-                MACD_colors = ['green' if df['MACD_Hist'][i] > 0 else 'red' for i in range(len(df))]
+                MACD_colors = np.where(df['MACD_Hist'] > 0, 'green', 'red')
 
                 fig.add_trace(go.Bar(x=df.index,
                                      y=df['MACD_Hist'],
@@ -382,7 +606,8 @@ def plot_candles_stick_bar(df, title="", currency=""):
         ),
         showlegend=True,
         xaxis_rangeslider_visible=False,
-        height=800
+        height=800,
+        uirevision=uirevision  # Zoom/pan survives reruns only while this value stays the same
     )
 
     return fig
@@ -939,8 +1164,7 @@ def plot_income(df, ticker="", currency=""):
 
             if component == "Total Revenue" or component == "Net Income Common Stockholders":
                 percentages = round(df.loc[component].astype('float64').pct_change(periods=-1) * 100, 1)
-                percentages = percentages.apply(
-                    lambda x: f"+{x}%" if x > 0 else ("" if pd.isna(x) else f"{x}%")).tolist()
+                percentages = pct_labels(percentages)
                 trace = go.Bar(
                     x=df.columns,
                     y=value,
@@ -1177,7 +1401,7 @@ def plot_capital(df, ticker="", currency=""):
     df = merge.copy()
 
     percentages = round(df['Market cap'].astype('float64').pct_change(periods=1) * 100, 1)
-    percentages = percentages.apply(lambda x: f"+{x}%" if x > 0 else ("" if pd.isna(x) else f"{x}%")).tolist()
+    percentages = pct_labels(percentages)
 
     # Create the line chart
     fig = go.Figure()
@@ -1269,7 +1493,7 @@ def plot_capital_multiple(tickers, tp="Annual"):
         df = merge.copy()
 
         percentages = round(df['Market cap'].astype('float64').pct_change(periods=1) * 100, 1)
-        percentages = percentages.apply(lambda x: f"+{x}%" if x > 0 else ("" if pd.isna(x) else f"{x}%")).tolist()
+        percentages = pct_labels(percentages)
 
         df.index = pd.to_datetime(df.index).strftime('%b %d, %Y')
 
@@ -1314,7 +1538,7 @@ def plot_balance_multiple(TICKERS, tp="Annual"):
         show_legend = ticker == TICKERS[0]
 
         percentages = round(df.loc['Total Assets'].astype('float64').pct_change(periods=1) * 100, 1)
-        percentages = percentages.apply(lambda x: f"+{x}%" if x > 0 else ("" if pd.isna(x) else f"{x}%")).tolist()
+        percentages = pct_labels(percentages)
 
         fig.add_trace(go.Bar(
             x=[[ticker] * len(df.columns), df.columns],
@@ -1365,7 +1589,7 @@ def plot_income_multiple(TICKERS, tp="Annual"):
         show_legend = ticker == TICKERS[0]
 
         percentages = round(df.loc['Total Revenue'].astype('float64').pct_change(periods=1) * 100, 1)
-        percentages = percentages.apply(lambda x: f"+{x}%" if x > 0 else ("" if pd.isna(x) else f"{x}%")).tolist()
+        percentages = pct_labels(percentages)
 
         fig.add_trace(go.Bar(
             x=[[ticker] * len(df.columns), df.columns],
@@ -1379,7 +1603,7 @@ def plot_income_multiple(TICKERS, tp="Annual"):
         ))
 
         percentages = round(df.loc['Net Income Common Stockholders'].astype('float64').pct_change(periods=1) * 100, 1)
-        percentages = percentages.apply(lambda x: f"+{x}%" if x > 0 else ("" if pd.isna(x) else f"{x}%")).tolist()
+        percentages = pct_labels(percentages)
 
         fig.add_trace(go.Bar(
             x=[[ticker] * len(df.columns), df.columns],
@@ -1435,7 +1659,7 @@ def plot_cash_multiple(TICKERS, tp="Annual"):
                         break
 
         percentages = round(df.loc['Operating Cash Flow'].astype('float64').pct_change(periods=1) * 100, 1)
-        percentages = percentages.apply(lambda x: f"+{x}%" if x > 0 else ("" if pd.isna(x) else f"{x}%")).tolist()
+        percentages = pct_labels(percentages)
 
         fig.add_trace(go.Bar(
             x=[[ticker] * len(df.columns), df.columns],
@@ -82,7 +82,7 @@ with st.sidebar:
 
     st.write(COMMODITY)
 
-    periods = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
+    periods = PERIOD_OPTIONS
 
     PERIOD = st.selectbox(
         label="Period",
@@ -91,7 +91,7 @@ with st.sidebar:
         placeholder="Select period...",
     )
 
-    intervals = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"]
+    intervals = INTERVAL_OPTIONS
 
     if PERIOD in intervals:
         idx = intervals.index(PERIOD)
@@ -109,7 +109,7 @@ with st.sidebar:
         value=True
     )
 
-    indicator_list = ['SMA_20', 'SMA_50', 'SMA_200', 'SMA_X', 'EMA_20', 'EMA_50', 'EMA_200', 'EMA_X', 'ATR', 'MACD', 'RSI']
+    indicator_list = INDICATOR_OPTIONS
 
     INDICATORS = st.multiselect(
         label="Technical indicators:",
@@ -133,6 +133,7 @@ with st.sidebar:
         fetch_table.clear()
         fetch_info.clear()
         fetch_history.clear()
+        clear_history_cache()
         # st.cache_data.clear()
 
     st.write("Last update:", st.session_state['current_time_commodity_page'])
@@ -173,22 +174,7 @@ if isinstance(df, Exception):
     st.error(df)
     fetch_table.clear(URL)
 else:
-    with st.container(border=True):
-        i = 0
-        for _ in range(2):
-            cols = st.columns(4, gap="small")
-            for col in cols:
-                with col:
-                    row = df[df['Symbol'] == COMMODITIES[i]].iloc[0]
-                    name = row['Name']
-                    symbol = row['Symbol']
-                    price, change, change_pt = row['Price'].split()
-                    st.metric(
-                        label=f'{name}',
-                        value=f'{price}',
-                        delta=f'{change} {change_pt}'
-                    )
-                i += 1
+    metrics_grid(df, rows=2, cols=4, symbols=COMMODITIES, show_symbol=False)
 
 #----SECOND SECTION----
 
@@ -255,9 +241,9 @@ if "RSI" in INDICATORS:
 
     df['RSI'] = 100 - (100 / (1 + rs))
 
-fig = plot_candles_stick_bar(df, "Candlestick Chart")
+fig = plot_candles_stick_bar(df, "Candlestick Chart", uirevision=f"{COMMODITY}|{PERIOD}|{INTERVAL}")
 
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
 with st.expander("Show data"):
     st.dataframe(
@@ -71,9 +71,11 @@ with st.sidebar:
         st.error("Only first 10 tickers are shown")
         TICKERS = TICKERS[:10]
 
+    INFOS = fetch_infos(TICKERS)
+
     _tickers = list()
     for TICKER in TICKERS:
-        info = fetch_info(TICKER)
+        info = INFOS[TICKER]
         if isinstance(info, Exception):
             st.error(info)
             fetch_info.clear(TICKER)
@@ -101,6 +103,10 @@ with st.sidebar:
         fetch_balance.clear()
         fetch_income.clear()
         fetch_cash.clear()
+        clear_statement_cache()
+        fetch_history.clear()
+        clear_history_cache()
+        get_ticker.cache_clear()
         #st.cache_data.clear()
 
     st.write("Last update:", st.session_state['current_time_financials_page'])
@@ -134,7 +140,7 @@ if len(TICKERS) == 1:
 
     TICKER = TICKERS[0]
 
-    info = fetch_info(TICKER)
+    info = INFOS[TICKER]
 
     NAME = info.get('shortName', "")
     st.write(f'{NAME}')
@@ -159,6 +165,7 @@ if len(TICKERS) == 1:
     st.plotly_chart(
         fig,
         use_container_width=True,
+        config=PLOTLY_CONFIG,
         # theme=None
     )
 
@@ -172,7 +179,7 @@ if len(TICKERS) == 1:
 
     fig = plot_balance(bs[bs.columns[::-1]], ticker=TICKER, currency=CURRENCY)
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     with st.expander("Show components"):
 
@@ -180,15 +187,15 @@ if len(TICKERS) == 1:
 
         with tab1:
             fig = plot_assets(bs, ticker=TICKER, currency=CURRENCY)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
         with tab2:
             fig = plot_liabilities(bs, ticker=TICKER, currency=CURRENCY)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
         with tab3:
             fig = plot_equity(bs, ticker=TICKER, currency=CURRENCY)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
 
 
@@ -213,7 +220,7 @@ if len(TICKERS) == 1:
 
     fig = plot_income(ist, ticker=TICKER, currency=CURRENCY)
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     with st.expander("Ratios"):
         tab1, tab2, tab3 = st.tabs(
@@ -230,6 +237,7 @@ if len(TICKERS) == 1:
                 st.plotly_chart(
                     fig,
                     use_container_width=True,
+                    config=PLOTLY_CONFIG,
                     #theme=None
                 )
             except:
@@ -245,6 +253,7 @@ if len(TICKERS) == 1:
                 st.plotly_chart(
                     fig,
                     use_container_width=True,
+                    config=PLOTLY_CONFIG,
                     #theme=None
                 )
             except:
@@ -260,6 +269,7 @@ if len(TICKERS) == 1:
                 st.plotly_chart(
                     fig,
                     use_container_width=True,
+                    config=PLOTLY_CONFIG,
                     # theme=None
                 )
             except:
@@ -285,7 +295,7 @@ if len(TICKERS) == 1:
 
     fig = plot_cash(cf, ticker=TICKER, currency=CURRENCY)
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     with st.expander("Show data"):
         st.dataframe(
@@ -304,6 +314,7 @@ else:
     st.plotly_chart(
         fig,
         use_container_width=True,
+        config=PLOTLY_CONFIG,
         # theme=None
     )
 
@@ -314,7 +325,7 @@ else:
 
     fig = plot_balance_multiple(TICKERS, tp=TIME_PERIOD)
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     # ----INCOME STATEMENT----
 
@@ -322,7 +333,7 @@ else:
 
     fig = plot_income_multiple(TICKERS, tp=TIME_PERIOD)
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     # ----CASH FLOW----
 
@@ -330,4 +341,4 @@ else:
 
     fig = plot_cash_multiple(TICKERS, tp=TIME_PERIOD)
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
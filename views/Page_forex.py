@@ -116,7 +116,7 @@ with st.sidebar:
 
     st.write(currencies_2[option2])
 
-    periods = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
+    periods = PERIOD_OPTIONS
 
     PERIOD = st.selectbox(
         label="Period",
@@ -125,7 +125,7 @@ with st.sidebar:
         placeholder="Select period...",
     )
 
-    intervals = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"]
+    intervals = INTERVAL_OPTIONS
 
     if PERIOD in intervals:
         idx = intervals.index(PERIOD)
@@ -140,7 +140,7 @@ with st.sidebar:
 
     if len(CURRENCY_1) == 1:
 
-        indicator_list = ['SMA_20', 'SMA_50', 'SMA_200', 'SMA_X', 'EMA_20', 'EMA_50', 'EMA_200', 'EMA_X', 'ATR', 'MACD', 'RSI']
+        indicator_list = INDICATOR_OPTIONS
 
         INDICATORS = st.multiselect(
             label="Technical indicators:",
@@ -162,8 +162,11 @@ with st.sidebar:
     if button:
         st.session_state['current_time_forex_page'] = datetime.datetime.now(st.session_state['timezone']).replace(microsecond=0, tzinfo=None)
         fetch_table.clear()
+        fetch_fast_info.clear()
         fetch_info.clear()
         fetch_history.clear()
+        clear_history_cache()
+        fetch_history_multiple.clear()
         # st.cache_data.clear()
 
     st.write("Last update:", st.session_state['current_time_forex_page'])
@@ -191,66 +194,42 @@ st.title("Forex Market")
 
 #----FIRST SECTION----
 
+URLS = [
+    "https://finance.yahoo.com/markets/currencies/",
+    "https://finance.yahoo.com/markets/crypto/all/",
+]
+
+tables = fetch_tables(URLS)
+
 col1, col2 = st.columns(2, gap="small")
 
 with col1:
 
-    URL = "https://finance.yahoo.com/markets/currencies/"
+    URL = URLS[0]
 
     CURRENCIES = ["EURUSD=X", "JPY=X", "GBPUSD=X", "AUDUSD=X", "CNY=X", "MXN=X", "INR=X", "SGD=X", "ZAR=X"]
 
-    df = fetch_table(URL)
+    df = tables[URL]
 
     st.subheader("Top Currencies")
     if isinstance(df, Exception):
         st.error(df)
         fetch_table.clear(URL)
     else:
-        with st.container(border=True):
-            i = 0
-            for _ in range(2):
-                cols = st.columns(3, gap="small")
-                for col in cols:
-                    with col:
-                        #row = df.iloc[i]
-                        row = df[df['Symbol'] == CURRENCIES[i]].iloc[0]
-                        name = row['Name']
-                        symbol = row['Symbol']
-                        price, change, change_pt = row['Price'].split()
-                        st.metric(
-                            label=f'{name}',
-                            value=f'{price}',
-                            delta=f'{change} {change_pt}'
-                        )
-                    i += 1
+        metrics_grid(df, rows=2, cols=3, symbols=CURRENCIES, show_symbol=False)
 
 with col2:
 
-    URL = "https://finance.yahoo.com/markets/crypto/all/"
+    URL = URLS[1]
 
-    df = fetch_table(URL)
+    df = tables[URL]
 
     st.subheader("Top Cryptos")
     if isinstance(df, Exception):
         st.error(df)
         fetch_table.clear(URL)
     else:
-        with st.container(border=True):
-            i = 0
-            for _ in range(2):
-                cols = st.columns(3, gap="small")
-                for col in cols:
-                    with col:
-                        row = df.iloc[i]
-                        name = row['Name']
-                        symbol = row['Symbol']
-                        price, change, change_pt = row['Price'].split()
-                        st.metric(
-                            label=f'{name}',
-                            value=f'{price}',
-                            delta=f'{change} {change_pt}'
-                        )
-                    i += 1
+        metrics_grid(df, rows=2, cols=3, show_symbol=False)
 
 #----SECOND SECTION----
 
@@ -267,16 +246,34 @@ if len(CURRENCY_1) == 1:
     else:
         TICKER = f'{CURRENCY_1}{CURRENCY_2}=X'
 
-    info = fetch_info(TICKER)
+    QUOTE_KEYS = ("previous_close", "day_low", "day_high")
 
-    if isinstance(info, Exception):
-        st.error(info)
-        fetch_info.clear(TICKER)
-        st.stop()
+    quote = fetch_fast_info(TICKER, keys=QUOTE_KEYS)
+
+    if isinstance(quote, Exception):
+        st.error(quote)
+        fetch_fast_info.clear(TICKER, keys=QUOTE_KEYS)
+        quote = dict.fromkeys(QUOTE_KEYS)
+
+    if None in quote.values():
+        # fast_info had nothing for this pair, fall back to .info
+        info = fetch_info(TICKER)
+
+        if isinstance(info, Exception):
+            st.error(info)
+            fetch_info.clear(TICKER)
+            st.stop()
 
-    EXCHANGE_RATE = info.get('previousClose', 0)
-    BID_PRICE = info.get('dayLow', 0)
-    ASK_PRICE = info.get('dayHigh', 0)
+        if quote['previous_close'] is None:
+            quote['previous_close'] = info.get('previousClose', 0)
+        if quote['day_low'] is None:
+            quote['day_low'] = info.get('dayLow', 0)
+        if quote['day_high'] is None:
+            quote['day_high'] = info.get('dayHigh', 0)
+
+    EXCHANGE_RATE = quote['previous_close']
+    BID_PRICE = quote['day_low']
+    ASK_PRICE = quote['day_high']
 
     col1, col2, col3 = st.columns(3, gap="medium")
 
@@ -348,9 +345,9 @@ if len(CURRENCY_1) == 1:
 
         df['RSI'] = 100 - (100 / (1 + rs))
 
-    fig = plot_candles_stick_bar(df, "Candlestick Chart")
+    fig = plot_candles_stick_bar(df, "Candlestick Chart", uirevision=f"{TICKER}|{PERIOD}|{INTERVAL}")
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
 
 else:
@@ -368,10 +365,25 @@ else:
         else:
             TICKERS.append(f'{currency}{CURRENCY_2}=X')
 
+    hists = fetch_history_multiple(TICKERS, period=PERIOD, interval=INTERVAL)
+
+    if isinstance(hists, Exception):
+        st.error(hists)
+        fetch_history_multiple.clear(TICKERS, period=PERIOD, interval=INTERVAL)
+        st.stop()
+
     dfs_hist = list()
     for TICKER in TICKERS:
 
-        hist = fetch_history(TICKER, period=PERIOD, interval=INTERVAL)
+        hist = hists[TICKER]
+
+        if isinstance(hist, Exception):
+            # Retry only this symbol on its own, the rest of the batch stays cached
+            hist = fetch_history(TICKER, period=PERIOD, interval=INTERVAL)
+
+            if not isinstance(hist, Exception) and hist.index.tz is not None:
+                # Same exchange-local, tz-naive index as the batch frames so they concat cleanly
+                hist.index = hist.index.tz_localize(None)
 
         if isinstance(hist, Exception):
             st.error(hist)
@@ -394,7 +406,7 @@ else:
 
     fig = plot_line_multiple(df, "Percent Change Line Chart")
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
 with st.expander("Show data"):
     st.dataframe(
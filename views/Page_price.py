@@ -118,9 +118,11 @@ with st.sidebar:
         st.error("Only first 10 tickers are shown")
         TICKERS = TICKERS[:10]
 
+    INFOS = fetch_infos(TICKERS)
+
     _tickers = list()
     for TICKER in TICKERS:
-        info = fetch_info(TICKER)
+        info = INFOS[TICKER]
         if isinstance(info, Exception):
             st.error(info)
             fetch_info.clear(TICKER)
@@ -133,7 +135,7 @@ with st.sidebar:
 
     TICKERS = _tickers
 
-    period_list = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
+    period_list = PERIOD_OPTIONS
 
     PERIOD = st.selectbox(
         label="Period",
@@ -142,7 +144,7 @@ with st.sidebar:
         placeholder="Select period...",
     )
 
-    interval_list = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"]
+    interval_list = INTERVAL_OPTIONS
 
     if PERIOD in interval_list:
         idx = interval_list.index(PERIOD)
@@ -162,7 +164,7 @@ with st.sidebar:
             value=True
         )
 
-        indicator_list = ['SMA_20', 'SMA_50', 'SMA_200', 'SMA_X', 'EMA_20', 'EMA_50', 'EMA_200', 'EMA_X', 'ATR', 'MACD', 'RSI']
+        indicator_list = INDICATOR_OPTIONS
 
         INDICATORS = st.multiselect(
             label="Technical indicators:",
@@ -186,6 +188,9 @@ with st.sidebar:
         fetch_table.clear()
         fetch_info.clear()
         fetch_history.clear()
+        clear_history_cache()
+        fetch_history_multiple.clear()
+        fetch_fast_info.clear()
         #st.cache_data.clear()
 
     st.write("Last update:", st.session_state['current_time_price_page'])
@@ -221,13 +226,21 @@ st.title("Stock Market")
 
 #----FIRST SECTION----
 
+URLS = [
+    "https://finance.yahoo.com/markets/world-indices/",
+    "https://finance.yahoo.com/markets/stocks/gainers/",
+    "https://finance.yahoo.com/markets/stocks/losers/",
+]
+
+tables = fetch_tables(URLS)
+
 col1, col2, col3 = st.columns(3, gap="small")
 
 with col1:
 
-    URL = "https://finance.yahoo.com/markets/world-indices/"
+    URL = URLS[0]
 
-    df = fetch_table(URL)
+    df = tables[URL]
 
     INDICES = ["^GSPC", "^DJI", "^IXIC", "^N225", "^GDAXI", "^MERV"]
 
@@ -236,78 +249,33 @@ with col1:
         st.error(df)
         fetch_table.clear(URL)
     if isinstance(df, pd.DataFrame):
-        with st.container(border=True):
-            i = 0
-            for _ in range(3):
-                cols = st.columns(2, gap="small")
-                for col in cols:
-                    with col:
-                        row = df[df['Symbol'] == INDICES[i]].iloc[0]
-                        name = row['Name']
-                        symbol = row['Symbol']
-                        price, change, change_pt = row['Price'].split()
-                        st.metric(
-                            label=f'{name} ({symbol})',
-                            value=f'{price}',
-                            delta=f'{change} {change_pt}'
-                        )
-                    i += 1
+        metrics_grid(df, rows=3, cols=2, symbols=INDICES)
 
 with col2:
 
-    URL = "https://finance.yahoo.com/markets/stocks/gainers/"
+    URL = URLS[1]
 
-    df = fetch_table(URL)
+    df = tables[URL]
 
     st.subheader("Top Gainers")
     if isinstance(df, Exception):
         st.error(df)
         fetch_table.clear(URL)
     if isinstance(df, pd.DataFrame):
-        with st.container(border=True):
-            i = 0
-            for _ in range(3):
-                cols = st.columns(2, gap="small")
-                for col in cols:
-                    with col:
-                        row = df.iloc[i]
-                        name = row['Name']
-                        symbol = row['Symbol']
-                        price, change, change_pt = row['Price'].split()
-                        st.metric(
-                            label=f'{name} ({symbol})',
-                            value=f'{price}',
-                            delta=f'{change} {change_pt}'
-                        )
-                    i += 1
+        metrics_grid(df, rows=3, cols=2)
 
 with col3:
 
-    URL = "https://finance.yahoo.com/markets/stocks/losers/"
+    URL = URLS[2]
 
-    df = fetch_table(URL)
+    df = tables[URL]
 
     st.subheader("Top Losers")
     if isinstance(df, Exception):
         st.error(df)
         fetch_table.clear(URL)
     if isinstance(df, pd.DataFrame):
-        with st.container(border=True):
-            i = 0
-            for _ in range(3):
-                cols = st.columns(2, gap="small")
-                for col in cols:
-                    with col:
-                        row = df.iloc[i]
-                        name = row['Name']
-                        symbol = row['Symbol']
-                        price, change, change_pt = row['Price'].split()
-                        st.metric(
-                            label=f'{name} ({symbol})',
-                            value=f'{price}',
-                            delta=f'{change} {change_pt}'
-                        )
-                    i += 1
+        metrics_grid(df, rows=3, cols=2)
 
 
 #----SECOND SECTION----
@@ -321,7 +289,7 @@ if len(TICKERS) == 1:
 
     TICKER = TICKERS[0]
 
-    info = fetch_info(TICKER)
+    info = INFOS[TICKER]
 
     NAME = info.get('shortName', "")
 
@@ -347,8 +315,6 @@ if len(TICKERS) == 1:
 
     #----METRICS----
     PREVIOUS_PRICE = info.get('previousClose', 0)
-    CHANGE = PRICE - PREVIOUS_PRICE
-    CHANGE_PER = (CHANGE/PREVIOUS_PRICE)*100
     HIGH = info.get('dayHigh', 0)
     LOW = info.get('dayLow', 0)
     CURRENCY = info.get('currency', "???")
@@ -356,6 +322,20 @@ if len(TICKERS) == 1:
     FIFTY_TWO_WEEK_LOW = info.get('fiftyTwoWeekLow', 0)
     FIFTY_TWO_WEEK_HIGH = info.get('fiftyTwoWeekHigh', 0)
 
+    quote = fetch_fast_info(TICKER)
+
+    if isinstance(quote, Exception):
+        st.error(quote)
+        fetch_fast_info.clear(TICKER)
+    else:
+        if quote['last_price'] is not None:
+            PRICE = quote['last_price']
+        if quote['previous_close'] is not None:
+            PREVIOUS_PRICE = quote['previous_close']
+
+    CHANGE = PRICE - PREVIOUS_PRICE
+    CHANGE_PER = (CHANGE/PREVIOUS_PRICE)*100
+
     if CHANGE_PER == 0:
         st.metric(
             "Latest Price",
@@ -471,12 +451,13 @@ if len(TICKERS) == 1:
 
         df['RSI'] = 100 - (100 / (1 + rs))
 
-    fig = plot_candles_stick_bar(df, title="Candlestick Chart", currency=CURRENCY)
+    fig = plot_candles_stick_bar(df, title="Candlestick Chart", currency=CURRENCY,
+                                 uirevision=f"{TICKER}|{PERIOD}|{INTERVAL}")
 
     fig.add_hline(y=FIFTY_TWO_WEEK_LOW, line=dict(color="black", dash="dash", width=1), annotation_text='52 Week Low', row=1, col=1)
     fig.add_hline(y=FIFTY_TWO_WEEK_HIGH, line=dict(color="black", dash="dash", width=1), annotation_text='52 Week High', row=1, col=1)
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     with st.expander("Show data"):
         st.dataframe(
@@ -493,14 +474,29 @@ else:
     dfs_hist = list()
     dfs_info = list()
 
+    hists = fetch_history_multiple(TICKERS, period=PERIOD, interval=INTERVAL)
+
+    if isinstance(hists, Exception):
+        st.error(hists)
+        fetch_history_multiple.clear(TICKERS, period=PERIOD, interval=INTERVAL)
+        st.stop()
+
     for TICKER in TICKERS:
-        info = fetch_info(TICKER)
+        info = INFOS[TICKER]
 
         df = info_table(info)
         df = df.rename(columns={0: TICKER})
         dfs_info.append(df)
 
-        hist = fetch_history(TICKER, period=PERIOD, interval=INTERVAL)
+        hist = hists[TICKER]
+
+        if isinstance(hist, Exception):
+            # Retry only this symbol on its own, the rest of the batch stays cached
+            hist = fetch_history(TICKER, period=PERIOD, interval=INTERVAL)
+
+            if not isinstance(hist, Exception) and hist.index.tz is not None:
+                # Same exchange-local, tz-naive index as the batch frames so they concat cleanly
+                hist.index = hist.index.tz_localize(None)
 
         if isinstance(hist, Exception):
             st.error(hist)
@@ -535,13 +531,13 @@ else:
 
     fig = performance_table(df, TICKERS)
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     # ----LINE CHART----
 
     fig = plot_line_multiple(df, "Percent Change Line Chart")
 
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     with st.expander("Show data"):
         st.dataframe(